@@ -1,8 +1,7 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Text, Boolean, Integer, BigInteger, ARRAY, JSON
+from sqlalchemy import Column, String, DateTime, ForeignKey, Text, Boolean, Integer, BigInteger, ARRAY, JSON, func
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID, JSONB, TIMESTAMP, BIGINT
 from pgvector.sqlalchemy import Vector
-from datetime import datetime
 from app.database import Base
 import uuid
 
@@ -11,7 +10,7 @@ class Company(Base):
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     name = Column(String(255), nullable=False)
-    created_at = Column(TIMESTAMP(timezone=True), default=datetime.utcnow)
+    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
     company_profile = Column(JSONB, nullable=True)
 
     # Relationships
@@ -28,7 +27,7 @@ class Project(Base):
     name = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
     company_id = Column(UUID(as_uuid=True), ForeignKey("companies.id"), nullable=False)
-    created_at = Column(TIMESTAMP(timezone=True), default=datetime.utcnow)
+    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
 
     # Relationships
     company = relationship("Company", back_populates="projects")
@@ -46,7 +45,7 @@ class Team(Base):
     project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id"), nullable=True)
     company_id = Column(UUID(as_uuid=True), ForeignKey("companies.id"), nullable=False)
     supervisor_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
-    created_at = Column(TIMESTAMP(timezone=True), default=datetime.utcnow)
+    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
 
     # Relationships
     project = relationship("Project", back_populates="teams")
@@ -67,7 +66,7 @@ class User(Base):
     company_id = Column(UUID(as_uuid=True), ForeignKey("companies.id"), nullable=False)
     team_id = Column(UUID(as_uuid=True), ForeignKey("teams.id"), nullable=True)
     project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id"), nullable=True)
-    created_at = Column(TIMESTAMP(timezone=True), default=datetime.utcnow)
+    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
     preferences = Column(JSONB, nullable=True)
 
     # Relationships
@@ -95,8 +94,8 @@ class Task(Base):
     original_prompt = Column(Text, nullable=True)
     project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id"), nullable=True)
     conversation_id = Column(UUID(as_uuid=True), ForeignKey("conversations.id"), nullable=True)
-    created_at = Column(TIMESTAMP(timezone=True), default=datetime.utcnow)
-    updated_at = Column(TIMESTAMP(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
+    updated_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), onupdate=func.now())
     completed_at = Column(TIMESTAMP(timezone=True), nullable=True)
     priority = Column(String(50), default="medium")
 
@@ -114,8 +113,8 @@ class Conversation(Base):
     participant_ids = Column(ARRAY(UUID(as_uuid=True)), nullable=False)
     project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id"), nullable=True)
     team_id = Column(UUID(as_uuid=True), ForeignKey("teams.id"), nullable=True)
-    created_at = Column(TIMESTAMP(timezone=True), default=datetime.utcnow)
-    last_message_at = Column(TIMESTAMP(timezone=True), default=datetime.utcnow)
+    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
+    last_message_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
 
     # Relationships
     project = relationship("Project", back_populates="conversations")
@@ -131,7 +130,7 @@ class Message(Base):
     sender_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     content = Column(Text, nullable=False)
     type = Column(String(50), nullable=False)
-    timestamp = Column(TIMESTAMP(timezone=True), default=datetime.utcnow)
+    timestamp = Column(TIMESTAMP(timezone=True), server_default=func.now())
     is_read = Column(Boolean, default=False)
 
     # Relationships
@@ -149,7 +148,7 @@ class Document(Base):
     uploaded_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id"), nullable=True)
     team_id = Column(UUID(as_uuid=True), ForeignKey("teams.id"), nullable=True)
-    created_at = Column(TIMESTAMP(timezone=True), default=datetime.utcnow)
+    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
     processed = Column(Boolean, default=False)
 
     # Relationships
@@ -166,7 +165,7 @@ class DocumentChunk(Base):
     chunk_text = Column(Text, nullable=False)
     chunk_order = Column(Integer, nullable=False)
     embedding = Column(Vector(1536), nullable=False)
-    created_at = Column(TIMESTAMP(timezone=True), default=datetime.utcnow)
+    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
 
     # Relationships
     document = relationship("Document", back_populates="chunks")
@@ -179,7 +178,7 @@ class MemoryVector(Base):
     company_id = Column(UUID(as_uuid=True), ForeignKey("companies.id"), nullable=True)
     content = Column(Text, nullable=False)
     embedding = Column(Vector(1536), nullable=False)
-    timestamp = Column(TIMESTAMP(timezone=True), default=datetime.utcnow)
+    timestamp = Column(TIMESTAMP(timezone=True), server_default=func.now())
     source_type = Column(String(100), nullable=True)
     source_id = Column(UUID(as_uuid=True), nullable=True)
 
@@ -195,7 +194,7 @@ class Notification(Base):
     type = Column(String(100), nullable=False)
     message = Column(Text, nullable=False)
     read_status = Column(Boolean, default=False)
-    created_at = Column(TIMESTAMP(timezone=True), default=datetime.utcnow)
+    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
     related_entity_type = Column(String(100), nullable=True)
     related_entity_id = Column(UUID(as_uuid=True), nullable=True)
 
@@ -210,8 +209,8 @@ class Integration(Base):
     integration_type = Column(String(100), nullable=False)
     config = Column(JSONB, nullable=False)
     enabled = Column(Boolean, default=True)
-    created_at = Column(TIMESTAMP(timezone=True), default=datetime.utcnow)
-    updated_at = Column(TIMESTAMP(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
+    updated_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # Relationships
     company = relationship("Company", back_populates="integrations")
@@ -71,7 +71,7 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 def get_password_hash(password: str) -> str:
     return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
 
-async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security), db: Session = Depends(get_db)):
+def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security), db: Session = Depends(get_db)):
     try:
         token = credentials.credentials
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
@@ -99,7 +99,7 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
     return user
 
 @router.post("/auth/login", response_model=TokenResponse)
-async def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
+def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
     """Login user with email and password"""
     try:
         # Find user by email
@@ -153,7 +153,7 @@ async def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
         )
 
 @router.post("/auth/signup", response_model=TokenResponse)
-async def signup(user_data: UserSignup, db: Session = Depends(get_db)):
+def signup(user_data: UserSignup, db: Session = Depends(get_db)):
     """Register a new user"""
     try:
         # Check if user already exists
@@ -224,7 +224,7 @@ async def signup(user_data: UserSignup, db: Session = Depends(get_db)):
         )
 
 @router.get("/auth/me", response_model=AuthUserResponse)
-async def get_current_user_info(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+def get_current_user_info(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
     """Get current user information"""
     try:
         return AuthUserResponse(
@@ -244,7 +244,7 @@ async def get_current_user_info(current_user: User = Depends(get_current_user),
         )
 
 @router.post("/auth/change-password")
-async def change_password(
+def change_password(
     password_data: PasswordChange, 
     current_user: User = Depends(get_current_user), 
     db: Session = Depends(get_db)
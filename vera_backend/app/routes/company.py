@@ -15,7 +15,7 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 @router.get("/companies", response_model=CompanyListResponse)
-async def get_companies(db: Session = Depends(get_db)):
+def get_companies(db: Session = Depends(get_db)):
     """Get all companies."""
     try:
         companies = db.query(Company).all()
@@ -28,7 +28,7 @@ async def get_companies(db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Error fetching companies: {str(e)}")
 
 @router.get("/companies/{company_id}", response_model=CompanyResponse)
-async def get_company(company_id: str, db: Session = Depends(get_db)):
+def get_company(company_id: str, db: Session = Depends(get_db)):
     """Get a specific company by ID."""
     try:
         company = db.query(Company).filter(Company.id == uuid.UUID(company_id)).first()
@@ -42,7 +42,7 @@ async def get_company(company_id: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Error fetching company: {str(e)}")
 
 @router.post("/companies", response_model=CompanyResponse)
-async def create_company(company_info: CompanyCreate, db: Session = Depends(get_db)):
+def create_company(company_info: CompanyCreate, db: Session = Depends(get_db)):
     """Create a new company."""
     try:
         company = Company(
@@ -64,7 +64,7 @@ async def create_company(company_info: CompanyCreate, db: Session = Depends(get_
         raise HTTPException(status_code=500, detail=f"Error creating company: {str(e)}")
 
 @router.put("/companies/{company_id}", response_model=CompanyResponse)
-async def update_company(company_id: str, company_update: CompanyUpdate, db: Session = Depends(get_db)):
+def update_company(company_id: str, company_update: CompanyUpdate, db: Session = Depends(get_db)):
     """Update a company."""
     try:
         company = db.query(Company).filter(Company.id == uuid.UUID(company_id)).first()
@@ -89,7 +89,7 @@ async def update_company(company_id: str, company_update: CompanyUpdate, db: Ses
         raise HTTPException(status_code=500, detail=f"Error updating company: {str(e)}")
 
 @router.delete("/companies/{company_id}")
-async def delete_company(company_id: str, db: Session = Depends(get_db)):
+def delete_company(company_id: str, db: Session = Depends(get_db)):
     """Delete a company."""
     try:
         company = db.query(Company).filter(Company.id == uuid.UUID(company_id)).first()
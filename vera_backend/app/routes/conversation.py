@@ -15,7 +15,7 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 @router.get("/conversations", response_model=ConversationListResponse)
-async def get_conversations(db: Session = Depends(get_db)):
+def get_conversations(db: Session = Depends(get_db)):
     """Get all conversations."""
     try:
         conversations = db.query(Conversation).options(
@@ -31,7 +31,7 @@ async def get_conversations(db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Error fetching conversations: {str(e)}")
 
 @router.get("/conversations/{conversation_id}", response_model=ConversationResponse)
-async def get_conversation(conversation_id: str, db: Session = Depends(get_db)):
+def get_conversation(conversation_id: str, db: Session = Depends(get_db)):
     """Get a specific conversation by ID."""
     try:
         conversation = db.query(Conversation).options(
@@ -48,7 +48,7 @@ async def get_conversation(conversation_id: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Error fetching conversation: {str(e)}")
 
 @router.get("/projects/{project_id}/conversations", response_model=ConversationListResponse)
-async def get_project_conversations(project_id: str, db: Session = Depends(get_db)):
+def get_project_conversations(project_id: str, db: Session = Depends(get_db)):
     """Get all conversations for a specific project."""
     try:
         conversations = db.query(Conversation).options(
@@ -64,7 +64,7 @@ async def get_project_conversations(project_id: str, db: Session = Depends(get_d
         raise HTTPException(status_code=500, detail=f"Error fetching conversations: {str(e)}")
 
 @router.get("/teams/{team_id}/conversations", response_model=ConversationListResponse)
-async def get_team_conversations(team_id: str, db: Session = Depends(get_db)):
+def get_team_conversations(team_id: str, db: Session = Depends(get_db)):
     """Get all conversations for a specific team."""
     try:
         conversations = db.query(Conversation).options(
@@ -80,7 +80,7 @@ async def get_team_conversations(team_id: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Error fetching conversations: {str(e)}")
 
 @router.post("/conversations", response_model=ConversationResponse)
-async def create_conversation(conversation_info: ConversationCreate, db: Session = Depends(get_db)):
+def create_conversation(conversation_info: ConversationCreate, db: Session = Depends(get_db)):
     """Create a new conversation."""
     try:
         # Verify project exists if provided
@@ -95,12 +95,12 @@ async def create_conversation(conversation_info: ConversationCreate, db: Session
             if not team:
                 raise HTTPException(status_code=404, detail="Team not found")
         
-        # Verify all participant users exist
+        # Verify all participant users exist with a single query
+        found_ids = {row.id for row in db.query(User.id).filter(User.id.in_(conversation_info.participant_ids)).all()}
         for participant_id in conversation_info.participant_ids:
-            user = db.query(User).filter(User.id == participant_id).first()
-            if not user:
+            if participant_id not in found_ids:
                 raise HTTPException(status_code=404, detail=f"User with ID {participant_id} not found")
-        
+
         conversation = Conversation(
             id=uuid.uuid4(),
             type=conversation_info.type,
@@ -128,7 +128,7 @@ async def create_conversation(conversation_info: ConversationCreate, db: Session
         raise HTTPException(status_code=500, detail=f"Error creating conversation: {str(e)}")
 
 @router.put("/conversations/{conversation_id}", response_model=ConversationResponse)
-async def update_conversation(conversation_id: str, conversation_update: ConversationUpdate, db: Session = Depends(get_db)):
+def update_conversation(conversation_id: str, conversation_update: ConversationUpdate, db: Session = Depends(get_db)):
     """Update a conversation."""
     try:
         conversation = db.query(Conversation).filter(Conversation.id == uuid.UUID(conversation_id)).first()
@@ -140,10 +140,10 @@ async def update_conversation(conversation_id: str, conversation_update: Convers
         if conversation_update.type is not None:
             conversation.type = conversation_update.type
         if conversation_update.participant_ids is not None:
-            # Verify all participant users exist
+            # Verify all participant users exist with a single query
+            found_ids = {row.id for row in db.query(User.id).filter(User.id.in_(conversation_update.participant_ids)).all()}
             for participant_id in conversation_update.participant_ids:
-                user = db.query(User).filter(User.id == participant_id).first()
-                if not user:
+                if participant_id not in found_ids:
                     raise HTTPException(status_code=404, detail=f"User with ID {participant_id} not found")
             conversation.participant_ids = conversation_update.participant_ids
         if conversation_update.project_id is not None:
@@ -176,7 +176,7 @@ async def update_conversation(conversation_id: str, conversation_update: Convers
         raise HTTPException(status_code=500, detail=f"Error updating conversation: {str(e)}")
 
 @router.delete("/conversations/{conversation_id}")
-async def delete_conversation(conversation_id: str, db: Session = Depends(get_db)):
+def delete_conversation(conversation_id: str, db: Session = Depends(get_db)):
     """Delete a conversation."""
     try:
         conversation = db.query(Conversation).filter(Conversation.id == uuid.UUID(conversation_id)).first()
@@ -2,6 +2,7 @@ from fastapi import APIRouter, HTTPException, Depends
 from sqlalchemy.orm import Session, joinedload
 from typing import List, Optional
 from pydantic import BaseModel
+import re
 import uuid
 from datetime import datetime
 import logging
@@ -16,6 +17,10 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Precompiled @Vira mention matcher: one case-insensitive pass over the
+# message instead of lowercasing the content per check
+VIRA_MENTION_RE = re.compile(r"@vira", re.IGNORECASE)
+
 # Additional models for enhanced messaging features
 class Contact(BaseModel):
     id: str
@@ -39,39 +44,51 @@ class SendMessageRequest(BaseModel):
     content: str
     attachments: Optional[List[dict]] = None
 
+# Helper function to look up the supervisor of a user's team once, so
+# per-contact permission checks don't re-run the same Team query
+def get_team_supervisor_id(db: Session, user: User) -> Optional[uuid.UUID]:
+    """Get the supervisor ID of the user's team, or None if not applicable."""
+    if not user.team_id:
+        return None
+    team = db.query(Team).filter(Team.id == user.team_id).first()
+    return team.supervisor_id if team else None
+
 # Helper function to check hierarchy-based permissions
-def can_message_user(current_user: User, target_user: User, db: Session) -> bool:
+def can_message_user(current_user: User, target_user: User, supervisor_id: Optional[uuid.UUID] = None) -> bool:
     """
     Check if current_user can message target_user based on hierarchy rules.
-    
+
     Rules:
     - Employees can message their peers and direct supervisors
     - Supervisors can message anyone in their team and their own supervisors
     - Cannot message users higher up in hierarchy unless they're your direct supervisor
+
+    supervisor_id is the supervisor of current_user's team (see
+    get_team_supervisor_id); callers resolve it once per request instead of
+    per target user.
     """
     # Same user
     if current_user.id == target_user.id:
         return False
-    
+
     # Same team - always allowed
     if current_user.team_id == target_user.team_id:
         return True
-    
+
     # If current user is supervisor, they can message employees
     if current_user.role == 'supervisor' and target_user.role == 'employee':
         return True
-    
+
     # If current user is employee, they can only message their direct supervisor
     if current_user.role == 'employee' and target_user.role == 'supervisor':
         # Check if target_user is the supervisor of current_user's team
-        team = db.query(Team).filter(Team.id == current_user.team_id).first()
-        if team and team.supervisor_id == target_user.id:
+        if supervisor_id is not None and supervisor_id == target_user.id:
             return True
-    
+
     return False
 
 @router.get("/contacts", response_model=List[Contact])
-async def get_contacts(current_user_id: str, db: Session = Depends(get_db)):
+def get_contacts(current_user_id: str, db: Session = Depends(get_db)):
     """Get all users as contacts with hierarchy-based permissions."""
     try:
         # Get current user
@@ -79,30 +96,33 @@ async def get_contacts(current_user_id: str, db: Session = Depends(get_db)):
         if not current_user:
             raise HTTPException(status_code=404, detail="User not found")
         
-        # Get all users with their relationships
+        # Get all other users with their relationships; excluding self in SQL
+        # avoids shipping and hydrating a row that is always discarded
         users = db.query(User).options(
             joinedload(User.company),
             joinedload(User.team),
             joinedload(User.project)
-        ).all()
-        
+        ).filter(User.id != current_user.id).all()
+
+        # Resolve the current user's team supervisor once for the whole list
+        supervisor_id = get_team_supervisor_id(db, current_user)
+
         contacts = []
         for user in users:
-            if user.id != current_user.id:  # Exclude self
-                can_message = can_message_user(current_user, user, db)
-                
-                contact = Contact(
-                    id=str(user.id),
-                    name=user.name,
-                    email=user.email,
-                    role=user.role,
-                    team_id=str(user.team_id) if user.team_id else None,
-                    team_name=user.team.name if user.team else None,
-                    company_name=user.company.name if user.company else None,
-                    is_online=True,  # Mock online status for now
-                    can_message=can_message
-                )
-                contacts.append(contact)
+            can_message = can_message_user(current_user, user, supervisor_id)
+
+            contact = Contact(
+                id=str(user.id),
+                name=user.name,
+                email=user.email,
+                role=user.role,
+                team_id=str(user.team_id) if user.team_id else None,
+                team_name=user.team.name if user.team else None,
+                company_name=user.company.name if user.company else None,
+                is_online=True,  # Mock online status for now
+                can_message=can_message
+            )
+            contacts.append(contact)
         
         return contacts
     except Exception as e:
@@ -110,26 +130,45 @@ async def get_contacts(current_user_id: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Error fetching contacts: {str(e)}")
 
 @router.get("/conversations/{conversation_id}/messages")
-async def get_messages(conversation_id: str, db: Session = Depends(get_db)):
-    """Get all messages for a conversation."""
+def get_messages(
+    conversation_id: str,
+    limit: Optional[int] = None,
+    before: Optional[datetime] = None,
+    db: Session = Depends(get_db)
+):
+    """Get messages for a conversation, oldest first.
+
+    When limit is given, only the latest N messages are returned; before
+    pages further back by excluding messages at or after that timestamp.
+    Both filters run in SQL so long histories are never fully loaded.
+    """
     try:
         # First verify the conversation exists
-        conversation = db.query(Conversation).filter(Conversation.id == uuid.UUID(conversation_id)).first()
+        conversation_uuid = uuid.UUID(conversation_id)
+        conversation = db.query(Conversation).filter(Conversation.id == conversation_uuid).first()
         if not conversation:
             raise HTTPException(status_code=404, detail="Conversation not found")
-        
-        messages = db.query(Message).options(
+
+        query = db.query(Message).options(
             joinedload(Message.sender),
             joinedload(Message.conversation)
-        ).filter(Message.conversation_id == uuid.UUID(conversation_id)).order_by(Message.timestamp).all()
-        
+        ).filter(Message.conversation_id == conversation_uuid)
+        if before is not None:
+            query = query.filter(Message.timestamp < before)
+        if limit is not None:
+            # Take the newest N, then restore chronological order
+            messages = query.order_by(Message.timestamp.desc()).limit(limit).all()
+            messages.reverse()
+        else:
+            messages = query.order_by(Message.timestamp).all()
+
         return [MessageResponse.from_orm(message) for message in messages]
     except Exception as e:
         logger.error(f"Error fetching messages for conversation {conversation_id}: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error fetching messages: {str(e)}")
 
 @router.post("/conversations/{conversation_id}/messages")
-async def send_message(
+def send_message(
     conversation_id: str, 
     request: SendMessageRequest,
     current_user_id: str,
@@ -158,15 +197,16 @@ async def send_message(
         )
         
         db.add(new_message)
-        db.commit()
-        db.refresh(new_message)
-        
-        # Update conversation's last_message_at
+        db.flush()  # populate message defaults (timestamp) without committing
+
+        # Update conversation's last_message_at in the same transaction so a
+        # single commit covers both writes
         conversation.last_message_at = new_message.timestamp
         db.commit()
+        db.refresh(new_message)
         
         # Check for @Vira mentions and trigger AI response if needed
-        if "@vira" in request.content.lower() or "@vira" in request.content:
+        if VIRA_MENTION_RE.search(request.content):
             # TODO: Integrate with AI service to generate response
             # This would call the existing AI service endpoints
             pass
@@ -177,7 +217,7 @@ async def send_message(
         raise HTTPException(status_code=500, detail=f"Error sending message: {str(e)}")
 
 @router.post("/conversations", response_model=dict)
-async def create_conversation(
+def create_conversation(
     request: CreateConversationRequest,
     current_user_id: str,
     db: Session = Depends(get_db)
@@ -189,25 +229,36 @@ async def create_conversation(
         if not current_user:
             raise HTTPException(status_code=404, detail="User not found")
         
-        # Validate participants
+        # Resolve the current user's team supervisor once for all participants
+        supervisor_id = get_team_supervisor_id(db, current_user)
+
+        # Parse and dedupe participant IDs up front so format errors are
+        # reported before any query runs
         participant_uuids = []
         for participant_id in request.participants:
             try:
                 participant_uuid = uuid.UUID(participant_id)
-                user = db.query(User).filter(User.id == participant_uuid).first()
-                if not user:
-                    raise HTTPException(status_code=404, detail=f"User {participant_id} not found")
-                
-                # Check hierarchy permissions
-                if not can_message_user(current_user, user, db):
-                    raise HTTPException(
-                        status_code=403, 
-                        detail=f"Cannot create conversation with {user.name} due to hierarchy restrictions"
-                    )
-                
-                participant_uuids.append(participant_uuid)
             except ValueError:
                 raise HTTPException(status_code=400, detail=f"Invalid user ID format: {participant_id}")
+            if participant_uuid not in participant_uuids:
+                participant_uuids.append(participant_uuid)
+
+        # Fetch every participant in a single query instead of one SELECT per ID
+        participants_by_id = {
+            user.id: user
+            for user in db.query(User).filter(User.id.in_(participant_uuids)).all()
+        }
+        for participant_uuid in participant_uuids:
+            user = participants_by_id.get(participant_uuid)
+            if not user:
+                raise HTTPException(status_code=404, detail=f"User {participant_uuid} not found")
+
+            # Check hierarchy permissions
+            if not can_message_user(current_user, user, supervisor_id):
+                raise HTTPException(
+                    status_code=403,
+                    detail=f"Cannot create conversation with {user.name} due to hierarchy restrictions"
+                )
         
         # Add current user to participants if not already included
         if current_user.id not in participant_uuids:
@@ -217,7 +268,8 @@ async def create_conversation(
         conversation_name = request.name
         if request.type == "direct" and len(participant_uuids) == 2:
             other_user_id = next(pid for pid in participant_uuids if pid != current_user.id)
-            other_user = db.query(User).filter(User.id == other_user_id).first()
+            # The other participant was already fetched during validation
+            other_user = participants_by_id.get(other_user_id)
             conversation_name = other_user.name if other_user else "Unknown User"
         elif not conversation_name:
             conversation_name = f"Group Chat ({len(participant_uuids)} members)"
@@ -226,9 +278,7 @@ async def create_conversation(
         new_conversation = Conversation(
             id=uuid.uuid4(),
             type=request.type,
-            participant_ids=participant_uuids,
-            created_at=datetime.now(),
-            last_message_at=datetime.now()
+            participant_ids=participant_uuids
         )
         
         db.add(new_conversation)
@@ -250,7 +300,7 @@ async def create_conversation(
         raise HTTPException(status_code=500, detail=f"Error creating conversation: {str(e)}")
 
 @router.get("/users/{user_id}/permissions")
-async def get_user_permissions(
+def get_user_permissions(
     user_id: str,
     current_user_id: str,
     db: Session = Depends(get_db)
@@ -263,7 +313,7 @@ async def get_user_permissions(
         if not current_user or not target_user:
             raise HTTPException(status_code=404, detail="User not found")
         
-        can_message = can_message_user(current_user, target_user, db)
+        can_message = can_message_user(current_user, target_user, get_team_supervisor_id(db, current_user))
         
         return {
             "can_message": can_message,
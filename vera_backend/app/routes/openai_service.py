@@ -10,6 +10,14 @@ from app.services.openai_service import get_completion, get_summary, transcribe_
 
 router = APIRouter()
 
+# How message types map onto OpenAI chat roles; anything unknown is a user.
+# A table lookup replaces the if/elif chain in the history formatters.
+ROLE_FOR_TYPE = {"ai": "assistant", "user": "user", "employee": "user"}
+
+# Only the most recent messages are forwarded to the model; older history
+# adds tokens (cost and latency) without improving the reply
+MAX_CONTEXT_MESSAGES = 50
+
 # Models
 class MessageRequest(BaseModel):
     content: str
@@ -68,20 +76,14 @@ async def trichat_respond(request: TriChatMessageRequest):
     try:
         # Format the messages for processing
         messages_for_context = []
-        for msg in request.messages:
-            role = "user"
-            if msg.get("type") == "ai":
-                role = "assistant"
-            elif msg.get("type") == "employee":
-                role = "user" # Employee is also a user in OpenAI's context
-                
+        for msg in request.messages[-MAX_CONTEXT_MESSAGES:]:
             messages_for_context.append({
-                "role": role,
+                "role": ROLE_FOR_TYPE.get(msg.get("type"), "user"),
                 "content": f"{msg.get('name', '')}: {msg.get('content', '')}"
             })
-        
+
         # Add the new message
-        new_msg_role = "user" if request.new_message.type in ["user", "employee"] else "assistant"
+        new_msg_role = ROLE_FOR_TYPE.get(request.new_message.type, "user")
         messages_for_context.append({
             "role": new_msg_role,
             "content": f"{request.new_message.name or ''}: {request.new_message.content}"
@@ -109,18 +111,15 @@ async def team_chat_respond(request: dict):
     """Process team chat messages and generate AI response"""
     try:
         messages = request.get("messages", [])
-        
-        # Format the messages for processing
-        messages_for_context = []
-        for msg in messages:
-            role = "user"
-            if msg.get("role") == "assistant":
-                role = "assistant"
-                
-            messages_for_context.append({
-                "role": role,
+
+        # Format the messages for processing in a single pass
+        messages_for_context = [
+            {
+                "role": "assistant" if msg.get("role") == "assistant" else "user",
                 "content": msg.get("content", "")
-            })
+            }
+            for msg in messages[-MAX_CONTEXT_MESSAGES:]
+        ]
         
         # Get AI response
         ai_response = await get_completion(
@@ -143,13 +142,12 @@ async def team_chat_respond(request: dict):
 async def summarize_conversation(request: SummaryRequest):
     """Summarize a conversation"""
     try:
-        # Format the messages for summarization
-        messages_for_summary = []
-        for msg in request.messages:
-            messages_for_summary.append(
-                f"{msg.get('name', '')}: {msg.get('content', '')}"
-            )
-        
+        # Format the messages for summarization in a single pass
+        messages_for_summary = [
+            f"{msg.get('name', '')}: {msg.get('content', '')}"
+            for msg in request.messages
+        ]
+
         # Get the summary
         summary = await get_summary(
             messages=messages_for_summary,
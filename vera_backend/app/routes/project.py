@@ -15,7 +15,7 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 @router.get("/projects", response_model=ProjectListResponse)
-async def get_projects(db: Session = Depends(get_db)):
+def get_projects(db: Session = Depends(get_db)):
     """Get all projects."""
     try:
         projects = db.query(Project).options(joinedload(Project.company)).all()
@@ -28,7 +28,7 @@ async def get_projects(db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Error fetching projects: {str(e)}")
 
 @router.get("/projects/{project_id}", response_model=ProjectResponse)
-async def get_project(project_id: str, db: Session = Depends(get_db)):
+def get_project(project_id: str, db: Session = Depends(get_db)):
     """Get a specific project by ID."""
     try:
         project = db.query(Project).options(joinedload(Project.company)).filter(Project.id == uuid.UUID(project_id)).first()
@@ -42,7 +42,7 @@ async def get_project(project_id: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Error fetching project: {str(e)}")
 
 @router.get("/companies/{company_id}/projects", response_model=ProjectListResponse)
-async def get_company_projects(company_id: str, db: Session = Depends(get_db)):
+def get_company_projects(company_id: str, db: Session = Depends(get_db)):
     """Get all projects for a specific company."""
     try:
         projects = db.query(Project).options(joinedload(Project.company)).filter(Project.company_id == uuid.UUID(company_id)).all()
@@ -55,7 +55,7 @@ async def get_company_projects(company_id: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Error fetching projects: {str(e)}")
 
 @router.post("/projects", response_model=ProjectResponse)
-async def create_project(project_info: ProjectCreate, db: Session = Depends(get_db)):
+def create_project(project_info: ProjectCreate, db: Session = Depends(get_db)):
     """Create a new project."""
     try:
         # Verify company exists
@@ -86,7 +86,7 @@ async def create_project(project_info: ProjectCreate, db: Session = Depends(get_
         raise HTTPException(status_code=500, detail=f"Error creating project: {str(e)}")
 
 @router.put("/projects/{project_id}", response_model=ProjectResponse)
-async def update_project(project_id: str, project_update: ProjectUpdate, db: Session = Depends(get_db)):
+def update_project(project_id: str, project_update: ProjectUpdate, db: Session = Depends(get_db)):
     """Update a project."""
     try:
         project = db.query(Project).filter(Project.id == uuid.UUID(project_id)).first()
@@ -120,7 +120,7 @@ async def update_project(project_id: str, project_update: ProjectUpdate, db: Ses
         raise HTTPException(status_code=500, detail=f"Error updating project: {str(e)}")
 
 @router.delete("/projects/{project_id}")
-async def delete_project(project_id: str, db: Session = Depends(get_db)):
+def delete_project(project_id: str, db: Session = Depends(get_db)):
     """Delete a project."""
     try:
         project = db.query(Project).filter(Project.id == uuid.UUID(project_id)).first()
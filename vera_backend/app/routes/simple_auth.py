@@ -54,7 +54,7 @@ def get_password_hash(password: str) -> str:
 
 security = HTTPBearer()
 
-async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security), db: Session = Depends(get_db)):
+def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security), db: Session = Depends(get_db)):
     try:
         token = credentials.credentials
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
@@ -82,7 +82,7 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
     return user
 
 @router.post("/simple-auth/login", response_model=SimpleTokenResponse)
-async def simple_login(user_credentials: SimpleLogin, db: Session = Depends(get_db)):
+def simple_login(user_credentials: SimpleLogin, db: Session = Depends(get_db)):
     """Simple login endpoint"""
     try:
         # Find user by email
@@ -126,7 +126,7 @@ async def simple_login(user_credentials: SimpleLogin, db: Session = Depends(get_
         )
 
 @router.post("/simple-auth/signup", response_model=SimpleTokenResponse)
-async def simple_signup(user_data: SimpleSignup, db: Session = Depends(get_db)):
+def simple_signup(user_data: SimpleSignup, db: Session = Depends(get_db)):
     """Simple signup endpoint"""
     try:
         # Check if user already exists
@@ -187,7 +187,7 @@ async def simple_signup(user_data: SimpleSignup, db: Session = Depends(get_db)):
         )
 
 @router.get("/simple-auth/me", response_model=SimpleUser)
-async def get_current_user_info(current_user: User = Depends(get_current_user)):
+def get_current_user_info(current_user: User = Depends(get_current_user)):
     """Get current user information"""
     try:
         return SimpleUser(
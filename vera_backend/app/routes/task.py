@@ -1,7 +1,6 @@
 from fastapi import APIRouter, HTTPException, Depends, Request
 from sqlalchemy.orm import Session, joinedload
 from typing import List
-from datetime import datetime
 import uuid
 import logging
 
@@ -17,9 +16,10 @@ router = APIRouter()
 
 def get_user_id_by_name(db: Session, name: str) -> str:
     """Get user ID by name. If user doesn't exist, create them."""
-    user = db.query(User).filter(User.name == name).first()
-    if user:
-        return user.id
+    # Only the ID is needed, so don't pull the full user row
+    user_id = db.query(User.id).filter(User.name == name).scalar()
+    if user_id:
+        return user_id
     # Create new user if they don't exist
     new_user = User(
         id=uuid.uuid4(),
@@ -100,7 +100,7 @@ def task_to_response(task: Task) -> TaskResponse:
     return TaskResponse(**task_dict)
 
 @router.get("/tasks", response_model=List[TaskResponse])
-async def get_tasks(db: Session = Depends(get_db)):
+def get_tasks(db: Session = Depends(get_db)):
     """Get all tasks."""
     try:
         # Query tasks with related information
@@ -115,7 +115,7 @@ async def get_tasks(db: Session = Depends(get_db)):
         return []
 
 @router.post("/tasks", response_model=TaskResponse)
-async def create_task(request: Request, task_info: TaskCreate, db: Session = Depends(get_db)):
+def create_task(request: Request, task_info: TaskCreate, db: Session = Depends(get_db)):
     """Create a new task."""
     print(f"Received task creation request: {task_info.dict()}")
     try:
@@ -161,7 +161,7 @@ async def create_task(request: Request, task_info: TaskCreate, db: Session = Dep
         raise HTTPException(status_code=500, detail=f"Error creating task: {str(e)}")
 
 @router.get("/tasks/{task_id}", response_model=TaskResponse)
-async def get_task(task_id: str, db: Session = Depends(get_db)):
+def get_task(task_id: str, db: Session = Depends(get_db)):
     """Get a specific task by ID."""
     try:
         task = db.query(Task).options(
@@ -179,7 +179,7 @@ async def get_task(task_id: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Error fetching task: {str(e)}")
 
 @router.put("/tasks/{task_id}", response_model=TaskResponse)
-async def update_task(task_id: str, task_update: TaskUpdate, db: Session = Depends(get_db)):
+def update_task(task_id: str, task_update: TaskUpdate, db: Session = Depends(get_db)):
     """Update a task."""
     try:
         task = db.query(Task).filter(Task.id == uuid.UUID(task_id)).first()
@@ -202,10 +202,8 @@ async def update_task(task_id: str, task_update: TaskUpdate, db: Session = Depen
             task.priority = task_update.priority
         if task_update.completed_at is not None:
             task.completed_at = task_update.completed_at
-        
-        # Update the updated_at timestamp
-        task.updated_at = datetime.utcnow()
-        
+
+        # updated_at is maintained by the column's onupdate default
         db.commit()
         db.refresh(task)
         
@@ -224,7 +222,7 @@ async def update_task(task_id: str, task_update: TaskUpdate, db: Session = Depen
         raise HTTPException(status_code=500, detail=f"Error updating task: {str(e)}")
 
 @router.delete("/tasks/{task_id}")
-async def delete_task(task_id: str, db: Session = Depends(get_db)):
+def delete_task(task_id: str, db: Session = Depends(get_db)):
     """Delete a task."""
     try:
         task = db.query(Task).filter(Task.id == uuid.UUID(task_id)).first()
@@ -15,7 +15,7 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 @router.get("/teams", response_model=TeamListResponse)
-async def get_teams(db: Session = Depends(get_db)):
+def get_teams(db: Session = Depends(get_db)):
     """Get all teams."""
     try:
         teams = db.query(Team).options(
@@ -33,7 +33,7 @@ async def get_teams(db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Error fetching teams: {str(e)}")
 
 @router.get("/teams/{team_id}", response_model=TeamResponse)
-async def get_team(team_id: str, db: Session = Depends(get_db)):
+def get_team(team_id: str, db: Session = Depends(get_db)):
     """Get a specific team by ID."""
     try:
         team = db.query(Team).options(
@@ -52,7 +52,7 @@ async def get_team(team_id: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Error fetching team: {str(e)}")
 
 @router.get("/companies/{company_id}/teams", response_model=TeamListResponse)
-async def get_company_teams(company_id: str, db: Session = Depends(get_db)):
+def get_company_teams(company_id: str, db: Session = Depends(get_db)):
     """Get all teams for a specific company."""
     try:
         teams = db.query(Team).options(
@@ -70,7 +70,7 @@ async def get_company_teams(company_id: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Error fetching teams: {str(e)}")
 
 @router.get("/projects/{project_id}/teams", response_model=TeamListResponse)
-async def get_project_teams(project_id: str, db: Session = Depends(get_db)):
+def get_project_teams(project_id: str, db: Session = Depends(get_db)):
     """Get all teams for a specific project."""
     try:
         teams = db.query(Team).options(
@@ -88,7 +88,7 @@ async def get_project_teams(project_id: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Error fetching teams: {str(e)}")
 
 @router.post("/teams", response_model=TeamResponse)
-async def create_team(team_info: TeamCreate, db: Session = Depends(get_db)):
+def create_team(team_info: TeamCreate, db: Session = Depends(get_db)):
     """Create a new team."""
     try:
         # Verify company exists
@@ -137,7 +137,7 @@ async def create_team(team_info: TeamCreate, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Error creating team: {str(e)}")
 
 @router.put("/teams/{team_id}", response_model=TeamResponse)
-async def update_team(team_id: str, team_update: TeamUpdate, db: Session = Depends(get_db)):
+def update_team(team_id: str, team_update: TeamUpdate, db: Session = Depends(get_db)):
     """Update a team."""
     try:
         team = db.query(Team).filter(Team.id == uuid.UUID(team_id)).first()
@@ -186,7 +186,7 @@ async def update_team(team_id: str, team_update: TeamUpdate, db: Session = Depen
         raise HTTPException(status_code=500, detail=f"Error updating team: {str(e)}")
 
 @router.delete("/teams/{team_id}")
-async def delete_team(team_id: str, db: Session = Depends(get_db)):
+def delete_team(team_id: str, db: Session = Depends(get_db)):
     """Delete a team."""
     try:
         team = db.query(Team).filter(Team.id == uuid.UUID(team_id)).first()
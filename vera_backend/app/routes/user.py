@@ -15,7 +15,7 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 @router.get("/users", response_model=UserListResponse)
-async def get_users(db: Session = Depends(get_db)):
+def get_users(db: Session = Depends(get_db)):
     """Get all users."""
     try:
         users = db.query(User).options(
@@ -32,7 +32,7 @@ async def get_users(db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Error fetching users: {str(e)}")
 
 @router.get("/users/{user_id}", response_model=UserResponse)
-async def get_user(user_id: str, db: Session = Depends(get_db)):
+def get_user(user_id: str, db: Session = Depends(get_db)):
     """Get a specific user by ID."""
     try:
         user = db.query(User).options(
@@ -50,7 +50,7 @@ async def get_user(user_id: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Error fetching user: {str(e)}")
 
 @router.get("/companies/{company_id}/users", response_model=UserListResponse)
-async def get_company_users(company_id: str, db: Session = Depends(get_db)):
+def get_company_users(company_id: str, db: Session = Depends(get_db)):
     """Get all users for a specific company."""
     try:
         users = db.query(User).options(
@@ -67,7 +67,7 @@ async def get_company_users(company_id: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Error fetching users: {str(e)}")
 
 @router.get("/teams/{team_id}/users", response_model=UserListResponse)
-async def get_team_users(team_id: str, db: Session = Depends(get_db)):
+def get_team_users(team_id: str, db: Session = Depends(get_db)):
     """Get all users for a specific team."""
     try:
         users = db.query(User).options(
@@ -84,7 +84,7 @@ async def get_team_users(team_id: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Error fetching users: {str(e)}")
 
 @router.get("/projects/{project_id}/users", response_model=UserListResponse)
-async def get_project_users(project_id: str, db: Session = Depends(get_db)):
+def get_project_users(project_id: str, db: Session = Depends(get_db)):
     """Get all users for a specific project."""
     try:
         users = db.query(User).options(
@@ -101,7 +101,7 @@ async def get_project_users(project_id: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Error fetching users: {str(e)}")
 
 @router.post("/users", response_model=UserResponse)
-async def create_user(user_info: UserCreate, db: Session = Depends(get_db)):
+def create_user(user_info: UserCreate, db: Session = Depends(get_db)):
     """Create a new user."""
     try:
         # Verify company exists
@@ -157,7 +157,7 @@ async def create_user(user_info: UserCreate, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Error creating user: {str(e)}")
 
 @router.put("/users/{user_id}", response_model=UserResponse)
-async def update_user(user_id: str, user_update: UserUpdate, db: Session = Depends(get_db)):
+def update_user(user_id: str, user_update: UserUpdate, db: Session = Depends(get_db)):
     """Update a user."""
     try:
         user = db.query(User).filter(User.id == uuid.UUID(user_id)).first()
@@ -218,7 +218,7 @@ async def update_user(user_id: str, user_update: UserUpdate, db: Session = Depen
         raise HTTPException(status_code=500, detail=f"Error updating user: {str(e)}")
 
 @router.delete("/users/{user_id}")
-async def delete_user(user_id: str, db: Session = Depends(get_db)):
+def delete_user(user_id: str, db: Session = Depends(get_db)):
     """Delete a user."""
     try:
         user = db.query(User).filter(User.id == uuid.UUID(user_id)).first()
@@ -1,126 +1,310 @@
 import os
+import re
+import time
+import random
+import hashlib
+import logging
 from typing import List, Optional, Dict
-from openai import OpenAI
+from openai import AsyncOpenAI, APIConnectionError, APIStatusError
 import asyncio
-import json
-from datetime import datetime
+import orjson
+from datetime import datetime, timezone
 import uuid
 import httpx
 
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
 # Initialize the OpenAI client
 api_key = os.getenv("OPENAI_API_KEY")
 if not api_key:
     raise ValueError("OPENAI_API_KEY environment variable is not set")
 
-# Initialize client with only the api_key parameter
-client = OpenAI(api_key=api_key)
+# Initialize client with only the api_key parameter. The async client keeps
+# API calls on the event loop instead of tying up a worker thread per call.
+client = AsyncOpenAI(api_key=api_key)
+
+# Precompiled case-insensitive matchers so prompts are scanned in one pass
+# instead of allocating a lowercased copy per keyword check.
+# "task" also covers "create task" and "new task".
+TASK_KEYWORD_RE = re.compile(r"assign|task|to do", re.IGNORECASE)
+BRIEFING_RE = re.compile(r"briefing", re.IGNORECASE)
+
+# Fallback assignee patterns ("John must ...", "assign to John"), compiled
+# once instead of on every failed extraction
+NAME_PATTERNS = [
+    re.compile(r'(\w+)\s+must\s+', re.IGNORECASE),
+    re.compile(r'assign\s+to\s+(\w+)', re.IGNORECASE),
+    re.compile(r'(\w+)\s+should\s+', re.IGNORECASE),
+    re.compile(r'(\w+)\s+needs\s+to\s+', re.IGNORECASE)
+]
+
+# Internal API endpoints, built once instead of inline per request
+API_BASE_URL = os.getenv("VERA_API_BASE_URL", "http://localhost:8000")
+USERS_URL = f"{API_BASE_URL}/api/users"
+COMPANIES_URL = f"{API_BASE_URL}/api/companies"
+TASKS_URL = f"{API_BASE_URL}/api/tasks"
+
+# One pooled async client for internal API calls; constructing a client per
+# request threw away the connection pool (and the keep-alive sockets) every
+# time
+http_client = httpx.AsyncClient()
+
+# Invariant system messages for get_completion, defined once instead of
+# being rebuilt inside the function on every call
+DEFAULT_SYSTEM_MESSAGE = "You are Vira, an AI assistant for teams. You are helpful, concise, and professional."
+BRIEFING_SYSTEM_MESSAGE = """You are Vira, an AI assistant providing a personalized briefing to a team member.
+                Your task is to summarize the team's progress and status in a clear, concise manner.
+
+                Focus on:
+                1. Individual team member contributions and progress
+                2. Any delays or issues that need supervisor attention
+                3. Upcoming deadlines and priorities
+                4. Team workload distribution and potential bottlenecks
+                5. Specific achievements and areas needing support
+
+                Write as if you're directly addressing the supervisor, highlighting:
+                - Who completed what tasks
+                - Who is behind schedule and why
+                - Who has upcoming critical deadlines
+                - Any team members who might need additional support
+
+                Keep it professional but conversational, as if you're giving a one-on-one update."""
+
+# Cache of recent conversation summaries keyed by input hash
+SUMMARY_CACHE_TTL = 300.0  # seconds
+SUMMARY_CACHE_MAX_ENTRIES = 128
+summary_cache = {}
+
+# Cache of recently extracted task fields keyed by normalized prompt hash.
+# The TTL is short so the date context baked into due-date math stays fresh.
+EXTRACTION_CACHE_TTL = 120.0  # seconds
+EXTRACTION_CACHE_MAX_ENTRIES = 128
+extraction_cache = {}
+
+# How many times to attempt an OpenAI call before giving up
+MAX_LLM_ATTEMPTS = 3
+
+# Fail fast during a provider outage instead of stacking retry loops: after
+# this many calls fail despite retries, the circuit opens and requests error
+# immediately until the reset window passes.
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_RESET_SECONDS = 30.0
+circuit_state = {"failures": 0, "open_until": 0.0}
+
+def record_llm_success():
+    circuit_state["failures"] = 0
+
+def record_llm_failure():
+    circuit_state["failures"] += 1
+    if circuit_state["failures"] >= CIRCUIT_FAILURE_THRESHOLD:
+        circuit_state["open_until"] = time.monotonic() + CIRCUIT_RESET_SECONDS
+        logger.warning("OpenAI circuit breaker opened for %.0fs after %d consecutive failures", CIRCUIT_RESET_SECONDS, circuit_state["failures"])
+
+def retry_delay(attempt: int, retry_after: Optional[str]) -> float:
+    """Exponential backoff with jitter, honoring a Retry-After header if given."""
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+    return min(2 ** attempt, 30.0) * (0.5 + random.random())
+
+async def create_chat_completion(**kwargs):
+    """Call chat.completions.create, retrying rate limits and server errors.
+
+    429s and 5xx responses are retried with exponential backoff and jitter
+    (Retry-After wins when OpenAI sends one); other API errors are raised
+    immediately. While the circuit breaker is open the call fails fast
+    without touching the API.
+    """
+    if time.monotonic() < circuit_state["open_until"]:
+        raise RuntimeError("OpenAI circuit breaker is open; failing fast")
+
+    for attempt in range(MAX_LLM_ATTEMPTS):
+        try:
+            response = await client.chat.completions.create(**kwargs)
+        except APIConnectionError:
+            if attempt == MAX_LLM_ATTEMPTS - 1:
+                record_llm_failure()
+                raise
+            delay = retry_delay(attempt, None)
+        except APIStatusError as e:
+            # Only rate limits and server-side errors are worth retrying;
+            # client errors don't indicate an outage
+            if e.status_code != 429 and e.status_code < 500:
+                raise
+            if attempt == MAX_LLM_ATTEMPTS - 1:
+                record_llm_failure()
+                raise
+            delay = retry_delay(attempt, e.response.headers.get("retry-after"))
+        else:
+            record_llm_success()
+            return response
+        logger.warning("OpenAI request failed (attempt %d/%d), retrying in %.1fs", attempt + 1, MAX_LLM_ATTEMPTS, delay)
+        await asyncio.sleep(delay)
+
+# The user roster changes rarely but is re-fetched on every task
+# extraction, so keep the listing in a short-lived in-process cache
+USERS_CACHE_TTL = 60.0  # seconds
+users_cache = {"expires_at": 0.0, "data": None}
+
+async def fetch_users() -> Optional[Dict]:
+    """Fetch the /api/users listing, serving cached data while it is fresh.
+
+    If the refresh fails and an expired copy is still around, serve that
+    instead of failing the caller: a slightly stale roster beats none.
+    """
+    if users_cache["data"] is not None and time.monotonic() < users_cache["expires_at"]:
+        return users_cache["data"]
+    try:
+        response = await http_client.get(USERS_URL)
+        if response.status_code == 200:
+            users_data = orjson.loads(response.content)
+            users_cache["data"] = users_data
+            users_cache["expires_at"] = time.monotonic() + USERS_CACHE_TTL
+            return users_data
+    except Exception as e:
+        logger.error("Error refreshing user listing: %s", e)
+    # Fall back to the stale copy if we have one
+    return users_cache["data"]
+
+def invalidate_users_cache():
+    """Drop the cached user listing after the roster changes."""
+    users_cache["data"] = None
 
 async def find_user_by_name(name: str) -> Optional[str]:
     """Find an existing user by name. Returns None if user doesn't exist."""
     try:
-        async with httpx.AsyncClient() as http_client:
-            response = await http_client.get("http://localhost:8000/api/users")
-            if response.status_code == 200:
-                users_data = response.json()
-                if users_data and "users" in users_data:
-                    for user in users_data["users"]:
-                        if user["name"].lower() == name.lower():
-                            print(f"Found existing user: {user['id']} for name: {name}")
-                            return user["id"]
-            
-            print(f"User '{name}' not found in existing team members")
-            return None
+        users_data = await fetch_users()
+        if users_data and "users" in users_data:
+            for user in users_data["users"]:
+                if user["name"].lower() == name.lower():
+                    logger.debug("Found existing user: %s for name: %s", user["id"], name)
+                    return user["id"]
+
+        logger.info("User %r not found in existing team members", name)
+        return None
     except Exception as e:
-        print(f"Error finding user by name {name}: {str(e)}")
+        logger.error("Error finding user by name %s: %s", name, e)
         return None
 
 async def get_or_create_default_user() -> Optional[str]:
     """Get or create a default user for task creation."""
     try:
-        async with httpx.AsyncClient() as http_client:
-            # First try to get an existing user
-            response = await http_client.get("http://localhost:8000/api/users")
-            if response.status_code == 200:
-                users_data = response.json()
-                if users_data and "users" in users_data and len(users_data["users"]) > 0:
-                    user_id = users_data["users"][0]["id"]
-                    print(f"Found existing user: {user_id}")
-                    return user_id  # Return the first user's ID
-            
-            # If no users exist, we need to create a company first, then a user
-            # First create a default company
-            company_data = {
-                "name": "Default Company",
-                "company_profile": {"description": "Default company for system tasks"}
-            }
-            
-            company_response = await http_client.post("http://localhost:8000/api/companies", json=company_data)
-            if company_response.status_code != 200:
-                print(f"Failed to create company: {company_response.status_code}")
-                # If we can't create a company, we can't create a user, so we'll use a fallback approach
-                return None
-            
-            company = company_response.json()
-            company_id = company["id"]
-            
-            # Now create a default user with the company ID
-            default_user_data = {
-                "name": "Default User",
-                "email": "default@company.com",
-                "role": "Employee",
-                "company_id": company_id
-            }
-            
-            user_response = await http_client.post("http://localhost:8000/api/users", json=default_user_data)
-            if user_response.status_code == 200:
-                user = user_response.json()
-                print(f"Created default user: {user['id']}")
-                return user["id"]
-            else:
-                print(f"Failed to create user: {user_response.status_code}")
-                return None
+        # First try to get an existing user
+        users_data = await fetch_users()
+        if users_data and "users" in users_data and len(users_data["users"]) > 0:
+            user_id = users_data["users"][0]["id"]
+            logger.debug("Found existing user: %s", user_id)
+            return user_id  # Return the first user's ID
+
+        # If no users exist, we need to create a company first, then a user
+        # First create a default company
+        company_data = {
+            "name": "Default Company",
+            "company_profile": {"description": "Default company for system tasks"}
+        }
+
+        company_response = await http_client.post(COMPANIES_URL, json=company_data)
+        if company_response.status_code != 200:
+            logger.error("Failed to create company: %s", company_response.status_code)
+            # If we can't create a company, we can't create a user, so we'll use a fallback approach
+            return None
+
+        company = company_response.json()
+        company_id = company["id"]
+
+        # Now create a default user with the company ID
+        default_user_data = {
+            "name": "Default User",
+            "email": "default@company.com",
+            "role": "Employee",
+            "company_id": company_id
+        }
+
+        user_response = await http_client.post(USERS_URL, json=default_user_data)
+        if user_response.status_code == 200:
+            user = user_response.json()
+            logger.info("Created default user: %s", user["id"])
+            invalidate_users_cache()
+            return user["id"]
+        else:
+            logger.error("Failed to create user: %s", user_response.status_code)
+            return None
     except Exception as e:
-        print(f"Error getting or creating default user: {str(e)}")
+        logger.error("Error getting or creating default user: %s", e)
         return None
 
-async def extract_task_info(prompt: str) -> Dict:    
-    current_time = datetime.utcnow()
-    """Extract task information from a prompt using OpenAI."""
-    system_prompt = f"""Extract task information from the following message. 
+# Fully static system prompt for task extraction. Keeping the timestamp out
+# of it makes the prefix byte-identical across calls, so the provider's
+# prompt caching can kick in; the current date travels with the user message.
+TASK_EXTRACTION_SYSTEM_PROMPT = """Extract task information from the message that follows the current date.
     Return a JSON object with the following fields:
     - name: A short title for the task
     - description: A detailed description of the task
     - status: One of 'pending', 'in-progress', 'completed', 'cancelled'
     - priority: One of 'low', 'medium', 'high'
-    - due_date: Today is {current_time.strftime('%Y-%m-%d %H:%M:%S')}. Use this information for calculating due date. The due date in YYYY-MM-DD format (if mentioned)
-    - assigned_to: The name of the person to assign the task to (only if a specific person is mentioned in the prompt, otherwise null)
-    - original_prompt: The original user prompt
+    - due_date: The due date in YYYY-MM-DD format (if mentioned), calculated from the current date given with the message
+    - assigned_to: The name of the person to assign the task to (only if a specific person is mentioned in the message, otherwise null)
+    - original_prompt: The original user message, without the current-date line
     Return ONLY the JSON object, nothing else.
     """
-    
+
+# The extraction date context only needs second precision, so the formatted
+# timestamp is rebuilt at most once per second instead of per request
+timestamp_cache = [0, ""]
+
+def utc_timestamp() -> str:
+    """Return the current UTC time as 'YYYY-MM-DD HH:MM:SS', cached per second."""
+    now = int(time.time())
+    if now != timestamp_cache[0]:
+        timestamp_cache[0] = now
+        timestamp_cache[1] = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+    return timestamp_cache[1]
+
+async def extract_task_info(prompt: str) -> Dict:
+    """Extract task information from a prompt using OpenAI."""
+    user_content = f"Current date: {utc_timestamp()}\n\nMessage: {prompt}"
+
+    extraction_key = hashlib.sha256(prompt.strip().lower().encode()).hexdigest()
+
     try:
-        response = await asyncio.to_thread(
-            client.chat.completions.create,
-            model="gpt-4",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.3  # Lower temperature for more consistent JSON output
-        )
-        
-        # Extract the JSON from the response
-        content = response.choices[0].message.content.strip()
-        # Remove any markdown code block syntax if present
-        content = content.replace('```json', '').replace('```', '').strip()
-        
-        # Debug: Print the raw content to see what we're getting
-        print(f"Raw OpenAI response: {content}")
-        
-        task_info = json.loads(content)
-        
-        # Get a valid user ID for created_by
-        created_by_user_id = await get_or_create_default_user()
+        cached = extraction_cache.get(extraction_key)
+        if cached and time.monotonic() < cached[0]:
+            # An identical prompt was extracted moments ago; reuse the parsed
+            # fields and skip the LLM call. User resolution and task creation
+            # still run per request.
+            task_info = dict(cached[1])
+            created_by_user_id = await get_or_create_default_user()
+        else:
+            # The OpenAI call and the created_by lookup are independent, so run
+            # them concurrently instead of waiting on them back to back
+            response, created_by_user_id = await asyncio.gather(
+                create_chat_completion(
+                    model="gpt-4o-mini",  # structured extraction doesn't need a frontier model
+                    messages=[
+                        {"role": "system", "content": TASK_EXTRACTION_SYSTEM_PROMPT},
+                        {"role": "user", "content": user_content}
+                    ],
+                    response_format={"type": "json_object"},
+                    temperature=0.3  # Lower temperature for more consistent JSON output
+                ),
+                get_or_create_default_user()
+            )
+
+            # JSON mode guarantees a bare JSON object, so no markdown fences to strip
+            content = response.choices[0].message.content.strip()
+
+            # Debug: Print the raw content to see what we're getting
+            logger.debug("Raw OpenAI response: %s", content)
+
+            task_info = orjson.loads(content)
+            if len(extraction_cache) >= EXTRACTION_CACHE_MAX_ENTRIES:
+                extraction_cache.clear()  # crude bound, same as the summary cache
+            extraction_cache[extraction_key] = (time.monotonic() + EXTRACTION_CACHE_TTL, dict(task_info))
+
         if not created_by_user_id:
             # If we can't get a valid user, we can't create the task
             raise Exception("No valid user found for task creation")
@@ -131,9 +315,9 @@ async def extract_task_info(prompt: str) -> Dict:
         if assigned_to_name:
             assigned_to_user_id = await find_user_by_name(assigned_to_name)
             if assigned_to_user_id:
-                print(f"Assigned task to user: {assigned_to_name} (ID: {assigned_to_user_id})")
+                logger.info("Assigned task to user: %s (ID: %s)", assigned_to_name, assigned_to_user_id)
             else:
-                print(f"Could not find user '{assigned_to_name}' in existing team members")
+                logger.info("Could not find user %r in existing team members", assigned_to_name)
         
         # Transform the response to match TaskCreate model expectations
         transformed_task_info = {
@@ -151,7 +335,7 @@ async def extract_task_info(prompt: str) -> Dict:
         
         return transformed_task_info
     except Exception as e:
-        print(f"Error extracting task info: {str(e)}")
+        logger.error("Error extracting task info: %s", e)
         # Return a default task structure if parsing fails
         created_by_user_id = await get_or_create_default_user()
         if not created_by_user_id:
@@ -160,21 +344,13 @@ async def extract_task_info(prompt: str) -> Dict:
         # Try to extract a name from the prompt for assignment
         assigned_to_user_id = None
         # Simple name extraction - look for common patterns like "John must", "assign to John", etc.
-        import re
-        name_patterns = [
-            r'(\w+)\s+must\s+',
-            r'assign\s+to\s+(\w+)',
-            r'(\w+)\s+should\s+',
-            r'(\w+)\s+needs\s+to\s+'
-        ]
-        
-        for pattern in name_patterns:
-            match = re.search(pattern, prompt, re.IGNORECASE)
+        for pattern in NAME_PATTERNS:
+            match = pattern.search(prompt)
             if match:
                 name = match.group(1)
                 assigned_to_user_id = await find_user_by_name(name)
                 if assigned_to_user_id:
-                    print(f"Extracted and assigned task to user: {name} (ID: {assigned_to_user_id})")
+                    logger.info("Extracted and assigned task to user: %s (ID: %s)", name, assigned_to_user_id)
                 break
         
         return {
@@ -204,27 +380,26 @@ async def get_completion(prompt: str, messages: Optional[List[dict]] = None, mod
     """
     try:
         # Check if the prompt contains task assignment keywords and is not a briefing explanation
-        task_keywords = ["assign", "task", "create task", "new task", "to do"]
-        if any(keyword in prompt.lower() for keyword in task_keywords) and "briefing" not in prompt.lower():
+        if TASK_KEYWORD_RE.search(prompt) and not BRIEFING_RE.search(prompt):
             task_info = await extract_task_info(prompt)
             
             # Create the task
-            async with httpx.AsyncClient() as http_client:
-                response = await http_client.post(
-                    "http://localhost:8000/api/tasks",
-                    json=task_info
-                )
-                if response.status_code == 200:
-                    task = response.json()
-                    assignee_name = task.get('assignee', {}).get('name', 'Unassigned') if task.get('assignee') else 'Unassigned'
-                    return f"I've created a task: '{task['name']}' assigned to {assignee_name}. Due date: {task.get('due_date', 'Not specified')}, Status: {task['status']}"
-                else:
-                    return "I tried to create the task but encountered an error. Please try again."
+            response = await http_client.post(
+                TASKS_URL,
+                json=task_info
+            )
+            if response.status_code == 200:
+                task = response.json()
+                # Bind the nested dict once instead of re-walking it per access
+                assignee = task.get('assignee')
+                assignee_name = assignee.get('name', 'Unassigned') if assignee else 'Unassigned'
+                return f"I've created a task: '{task['name']}' assigned to {assignee_name}. Due date: {task.get('due_date', 'Not specified')}, Status: {task['status']}"
+            else:
+                return "I tried to create the task but encountered an error. Please try again."
         
         # If messages are provided, use chat completion
         if messages:
-            response = await asyncio.to_thread(
-                client.chat.completions.create,
+            response = await create_chat_completion(
                 model=model,
                 messages=messages,
                 max_tokens=max_tokens,
@@ -234,28 +409,9 @@ async def get_completion(prompt: str, messages: Optional[List[dict]] = None, mod
         
         # Otherwise, use a system message + user prompt
         else:
-            system_message = "You are Vira, an AI assistant for teams. You are helpful, concise, and professional."
-            if "briefing" in prompt.lower():
-                system_message = """You are Vira, an AI assistant providing a personalized briefing to a team member.
-                Your task is to summarize the team's progress and status in a clear, concise manner.
-                
-                Focus on:
-                1. Individual team member contributions and progress
-                2. Any delays or issues that need supervisor attention
-                3. Upcoming deadlines and priorities
-                4. Team workload distribution and potential bottlenecks
-                5. Specific achievements and areas needing support
-                
-                Write as if you're directly addressing the supervisor, highlighting:
-                - Who completed what tasks
-                - Who is behind schedule and why
-                - Who has upcoming critical deadlines
-                - Any team members who might need additional support
-                
-                Keep it professional but conversational, as if you're giving a one-on-one update."""
-            
-            response = await asyncio.to_thread(
-                client.chat.completions.create,
+            system_message = BRIEFING_SYSTEM_MESSAGE if BRIEFING_RE.search(prompt) else DEFAULT_SYSTEM_MESSAGE
+
+            response = await create_chat_completion(
                 model=model,
                 messages=[
                     {"role": "system", "content": system_message},
@@ -266,7 +422,7 @@ async def get_completion(prompt: str, messages: Optional[List[dict]] = None, mod
             )
             return response.choices[0].message.content.strip()
     except Exception as e:
-        print(f"OpenAI API error: {str(e)}")
+        logger.error("OpenAI API error: %s", e)
         raise
 
 async def get_summary(messages: List[str], max_tokens: int = 200) -> str:
@@ -283,7 +439,15 @@ async def get_summary(messages: List[str], max_tokens: int = 200) -> str:
     try:
         # Join messages with newlines
         conversation_text = "\n".join(messages)
-        
+
+        # Summaries are a pure function of their input, so identical requests
+        # within the TTL reuse the previous completion instead of paying for
+        # another LLM call
+        cache_key = hashlib.sha256(f"{max_tokens}:{conversation_text}".encode()).hexdigest()
+        cached = summary_cache.get(cache_key)
+        if cached and time.monotonic() < cached[0]:
+            return cached[1]
+
         # Create a prompt for summarization
         prompt = f"""
         Please provide a concise summary of the following conversation:
@@ -293,8 +457,7 @@ async def get_summary(messages: List[str], max_tokens: int = 200) -> str:
         Summary:
         """
         
-        response = await asyncio.to_thread(
-            client.chat.completions.create,
+        response = await create_chat_completion(
             model="gpt-4o",
             messages=[
                 {"role": "system", "content": "You are a professional assistant that creates concise, factual summaries."},
@@ -303,10 +466,14 @@ async def get_summary(messages: List[str], max_tokens: int = 200) -> str:
             max_tokens=max_tokens,
             temperature=0.3
         )
-        
-        return response.choices[0].message.content.strip()
+
+        summary = response.choices[0].message.content.strip()
+        if len(summary_cache) >= SUMMARY_CACHE_MAX_ENTRIES:
+            summary_cache.clear()  # crude bound; keeps the cache from growing forever
+        summary_cache[cache_key] = (time.monotonic() + SUMMARY_CACHE_TTL, summary)
+        return summary
     except Exception as e:
-        print(f"OpenAI API error: {str(e)}")
+        logger.error("OpenAI API error: %s", e)
         raise
 
 async def transcribe_audio(audio_file_path: str) -> str:
@@ -321,13 +488,12 @@ async def transcribe_audio(audio_file_path: str) -> str:
     """
     try:
         with open(audio_file_path, "rb") as audio_file:
-            response = await asyncio.to_thread(
-                client.audio.transcriptions.create,
+            response = await client.audio.transcriptions.create(
                 model="whisper-1",
                 file=audio_file,
                 response_format="text"
             )
         return response
     except Exception as e:
-        print(f"Whisper API error: {str(e)}")
+        logger.error("Whisper API error: %s", e)
         raise 
\ No newline at end of file